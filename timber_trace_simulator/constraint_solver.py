@@ -10,13 +10,31 @@ Enforces physical validity by solving:
 
 CRITICAL: theta_z (rotation) is CONSTANT during optimization.
 Only positions (x,y,z) and morphology are optimized.
+
+Because theta_z is fixed, every contact/identity/inequality constraint is
+AFFINE in the unknowns. They are assembled numerically into sparse
+A_eq @ X == b_eq and A_ineq @ X <= b_ineq over ONE stacked variable X,
+so CVXPY canonicalizes two matrix constraints instead of thousands of
+scalar expressions.
 """
 
 import numpy as np
 import cvxpy as cp
+import scipy.sparse as sp
 from typing import Dict, List, Tuple
 from object_definitions import BeamBase, ConstraintEquation
-from utils.cvxpy_helpers import extract_slack_tokens, evaluate_expression
+from utils.cvxpy_helpers import linearize_expression
+
+# Canonicalization backend passed to problem.solve().
+# CPP benchmarked fastest for both the 3-beam and the full Pfettendach problem
+# (SCIPY / COO were ~1.7x slower), so it is pinned instead of left to CVXPY's default.
+_CANON_BACKEND = cp.CPP_CANON_BACKEND
+
+# Position parameters (solver variables ahead of each beam's morphology)
+_POSITION_KEYS = ('x', 'y', 'z')
+
+# Solver statuses accepted as a solution
+_OK_STATUSES = frozenset(('optimal', 'optimal_inaccurate'))
 
 
 class SolverError(Exception):
@@ -59,43 +77,47 @@ def solve_constraints(beams: List[BeamBase],
         print(f"\n🔧 Starting constraint solver for {len(beams)} beams...")
     
     # =========================================================================
-    # STEP 1: Create CVXPY variables for each beam
+    # STEP 1: Assign columns of X to each beam's variables
     # =========================================================================
     # Note: theta_z is NOT a variable - it stays at initial value
-    cvxpy_vars_list = []
-    initial_params_list = []
+    # Layout: [beam parameters | slacks + violations (allocated per contact)]
+    # get_parameters() is evaluated ONCE per beam and reused by every step below
+    var_cols_list = []
+    params_list = []
+    x0 = []
+    weights = []
     
     for beam in beams:
         params = beam.get_parameters()
         param_dict = params['values']
         morphology_keys = params['morphology_keys']
         
-        # Create variables for position (x, y, z) and morphology
-        beam_vars = {
-            'x': cp.Variable(),
-            'y': cp.Variable(),
-            'z': cp.Variable(),
-        }
-        
-        # Add morphology variables
-        for key in morphology_keys:
-            beam_vars[key] = cp.Variable()
+        # Variables for position (x, y, z) and morphology
+        beam_cols = {}
+        for key in _POSITION_KEYS + tuple(morphology_keys):
+            beam_cols[key] = len(x0)
+            x0.append(param_dict[key])
+            # Position changes are cheap, Morphology changes are expensive
+            weights.append(1.0 if key in _POSITION_KEYS else morphology_weight)
         
-        cvxpy_vars_list.append(beam_vars)
-        initial_params_list.append(param_dict)
+        var_cols_list.append(beam_cols)
+        params_list.append(params)
+    
+    num_params = len(x0)
+    num_cols = num_params
     
     if verbose:
-        print(f"   Variables created: {sum(len(v) for v in cvxpy_vars_list)} total")
+        print(f"   Variables created: {num_params} total")
+    
+    # Sparse triplets for A_eq / A_ineq
+    eq_rows, eq_cols, eq_vals, b_eq = [], [], [], []
+    ineq_rows, ineq_cols, ineq_vals, b_ineq = [], [], [], []
     
     # =========================================================================
     # STEP 2: Build contact constraints (Relaxed with Penalties)
     # =========================================================================
-    constraints = []
-    slack_vars = {}
-    slack_counter = 0
-    
-    # Store violation variables to add to objective later: [(vx, vy, vz, debug_name), ...]
-    violation_vars = []
+    # Store violation columns to add to objective later: [(col_x, debug_name), ...]
+    violation_cols = []
     
     connectivity = topology.get('connectivity', {})
     
@@ -113,47 +135,37 @@ def solve_constraints(beams: List[BeamBase],
             eq_i = beam_i.get_constraints(face_i, constr_idx_i)
             eq_j = beam_j.get_constraints(face_j, constr_idx_j)
             
-            # --- CORRECTION: DECOUPLED SLACK VARIABLES ---
-            # Create separate slack variables for Beam I
-            slacks_i = {}
-            for s in range(eq_i.slack_count):
-                global_var = cp.Variable()
-                # Map local name (e.g., "slack_0") to a unique, independent CVXPY variable
-                slacks_i[f"slack_{s}"] = global_var 
-                # Keep track globally for debugging
-                slack_vars[f"slack_{slack_counter}"] = global_var
-                slack_counter += 1
-
-            # Create separate slack variables for Beam J
-            slacks_j = {}
-            for s in range(eq_j.slack_count):
-                global_var = cp.Variable()
-                slacks_j[f"slack_{s}"] = global_var 
-                slack_vars[f"slack_{slack_counter}"] = global_var
-                slack_counter += 1
+            # --- DECOUPLED SLACK VARIABLES ---
+            # Each beam gets its own slack columns, so Beam I's point can move
+            # independently along its surface to match Beam J's point on its surface.
+            slacks_i = {f"slack_{s}": num_cols + s for s in range(eq_i.slack_count)}
+            num_cols += eq_i.slack_count
+            slacks_j = {f"slack_{s}": num_cols + s for s in range(eq_j.slack_count)}
+            num_cols += eq_j.slack_count
             
-            # Evaluate points using INDEPENDENT slack dictionaries
-            # This allows Beam I's point to move independently along its surface
-            # to match Beam J's point on its surface.
-            p_i = _evaluate_constraint_point(eq_i, beam_i, cvxpy_vars_list[beam_i_idx], slacks_i)
-            p_j = _evaluate_constraint_point(eq_j, beam_j, cvxpy_vars_list[beam_j_idx], slacks_j)
+            A_i, c_i = _linearize_constraint_point(eq_i, beam_i, params_list[beam_i_idx]['values'],
+                                                   var_cols_list[beam_i_idx], slacks_i)
+            A_j, c_j = _linearize_constraint_point(eq_j, beam_j, params_list[beam_j_idx]['values'],
+                                                   var_cols_list[beam_j_idx], slacks_j)
             
-            # --- SOFT CONSTRAINT CHANGE ---
+            # --- SOFT CONSTRAINT ---
             # Instead of p_i == p_j, we allow a small violation 'v'
-            # p_i - p_j == v   (Minimize v^2)
-            
-            v_x = cp.Variable()
-            v_y = cp.Variable()
-            v_z = cp.Variable()
+            # p_i - p_j - v == 0   (Minimize v^2)
+            v_col = num_cols
+            num_cols += 3
             
             # Track for objective function and debugging
             debug_info = f"{face_name.upper()}: Beam {beam_i_idx} ({type(beam_i).__name__}) <-> Beam {beam_j_idx} ({type(beam_j).__name__})"
-            violation_vars.append((v_x, v_y, v_z, debug_info))
+            violation_cols.append((v_col, debug_info))
             
-            # Add relaxed constraints
-            constraints.append(p_i[0] - p_j[0] == v_x)
-            constraints.append(p_i[1] - p_j[1] == v_y)
-            constraints.append(p_i[2] - p_j[2] == v_z)
+            for d in range(3):
+                row = len(b_eq)
+                for col, val in A_i[d].items():
+                    eq_rows.append(row); eq_cols.append(col); eq_vals.append(val)
+                for col, val in A_j[d].items():
+                    eq_rows.append(row); eq_cols.append(col); eq_vals.append(-val)
+                eq_rows.append(row); eq_cols.append(v_col + d); eq_vals.append(-1.0)
+                b_eq.append(c_j[d] - c_i[d])
     
     # =========================================================================
     # STEP 3: Add identity constraints (morphology only)
@@ -161,22 +173,21 @@ def solve_constraints(beams: List[BeamBase],
     identity_pairs = topology.get('identity_pairs', [])
     
     for beam_i_idx, beam_j_idx in identity_pairs:
-        beam_i = beams[beam_i_idx]
-        beam_j = beams[beam_j_idx]
-        
         # Get morphology keys
-        morph_keys_i = beam_i.get_parameters()['morphology_keys']
-        morph_keys_j = beam_j.get_parameters()['morphology_keys']
+        morph_keys_i = params_list[beam_i_idx]['morphology_keys']
+        morph_keys_j = params_list[beam_j_idx]['morphology_keys']
         
         # They must have same morphology structure
         if set(morph_keys_i) != set(morph_keys_j):
             raise ValueError(f"Identity pair ({beam_i_idx}, {beam_j_idx}) has incompatible types")
         
-        # Add equality constraints for each morphology parameter
+        # Add equality row for each morphology parameter
         for key in morph_keys_i:
-            constraints.append(
-                cvxpy_vars_list[beam_i_idx][key] == cvxpy_vars_list[beam_j_idx][key]
-            )
+            row = len(b_eq)
+            eq_rows.extend((row, row))
+            eq_cols.extend((var_cols_list[beam_i_idx][key], var_cols_list[beam_j_idx][key]))
+            eq_vals.extend((1.0, -1.0))
+            b_eq.append(0.0)
     
     if verbose and identity_pairs:
         print(f"   Identity pairs: {len(identity_pairs)}")
@@ -186,74 +197,70 @@ def solve_constraints(beams: List[BeamBase],
     # =========================================================================
     for beam_idx, beam in enumerate(beams):
         safety_rules = beam.get_inequality_constraints()
+        if not safety_rules:
+            continue
         
-        # We need the variables for this specific beam
-        beam_vars = cvxpy_vars_list[beam_idx]
+        beam_cols = var_cols_list[beam_idx]
+        var_names = list(beam_cols)
         
-        # We also need the current parameter values (for constants in expressions)
-        # and we pass the CVXPY variables so they are used in the expression
-        beam_params_dict = beam.get_parameters()['values']
+        # Current parameter values provide the constants in expressions
+        beam_params_dict = params_list[beam_idx]['values']
         
         for lhs_str, rhs_str in safety_rules:
-            # Evaluate Left Hand Side (LHS) -> CVXPY Expression
-            lhs_expr = evaluate_expression(
-                lhs_str, 
-                beam_params_dict, 
-                cvxpy_vars=beam_vars
-            )
-            
-            # Evaluate Right Hand Side (RHS) -> CVXPY Expression
-            rhs_expr = evaluate_expression(
-                rhs_str, 
-                beam_params_dict, 
-                cvxpy_vars=beam_vars
-            )
+            lhs_coeffs, lhs_const = linearize_expression(lhs_str, beam_params_dict, var_names, [])
+            rhs_coeffs, rhs_const = linearize_expression(rhs_str, beam_params_dict, var_names, [])
             
-            # Add constraint: LHS <= RHS
-            constraints.append(lhs_expr <= rhs_expr)
+            # LHS <= RHS  ->  (LHS - RHS) @ X <= rhs_const - lhs_const
+            row = len(b_ineq)
+            coeffs = dict(lhs_coeffs)
+            for name, val in rhs_coeffs.items():
+                coeffs[name] = coeffs.get(name, 0.0) - val
+            for name, val in coeffs.items():
+                ineq_rows.append(row); ineq_cols.append(beam_cols[name]); ineq_vals.append(val)
+            b_ineq.append(rhs_const - lhs_const)
 
     # =========================================================================
-    # STEP 4: Add parameter bounds
+    # STEP 4: Collect parameter bounds
     # =========================================================================
+    bound_cols, lower_bounds, upper_bounds = [], [], []
+    
     for beam_idx, beam in enumerate(beams):
         bounds = beam.get_parameter_bounds()
-        vars_dict = cvxpy_vars_list[beam_idx]
         
-        for param_name, var in vars_dict.items():
+        for param_name, col in var_cols_list[beam_idx].items():
             if param_name in bounds:
                 lower, upper = bounds[param_name]
-                constraints.append(var >= lower)
-                constraints.append(var <= upper)
+                bound_cols.append(col)
+                lower_bounds.append(lower)
+                upper_bounds.append(upper)
     
     # =========================================================================
-    # STEP 5: Build objective function (stay close to initial values)
+    # STEP 5: Assemble problem (stay close to initial values)
     # =========================================================================
-    objective_terms = []
+    X = cp.Variable(num_cols)
     
-    for beam_idx, vars_dict in enumerate(cvxpy_vars_list):
-        initial_params = initial_params_list[beam_idx]
-        
-        for param_name, var in vars_dict.items():
-            initial_val = initial_params[param_name]
-            
-            # Apply weights: Position changes are cheap, Morphology changes are expensive
-            if param_name in ['x', 'y', 'z']:
-                weight = 1.0
-            else:
-                weight = morphology_weight
-            
-            # Squared deviation with max_adjustment clipping
-            deviation = var - initial_val
-            objective_terms.append(weight * cp.square(deviation))   
-    
-    # Add heavy penalties for constraint violations
-    for vx, vy, vz, _ in violation_vars:
-        # Heavily penalize any gap between connected parts
-        objective_terms.append(constraint_weight * cp.square(vx))
-        objective_terms.append(constraint_weight * cp.square(vy))
-        objective_terms.append(constraint_weight * cp.square(vz))
+    constraints = []
+    if b_eq:
+        A_eq = sp.csr_matrix((eq_vals, (eq_rows, eq_cols)), shape=(len(b_eq), num_cols))
+        constraints.append(A_eq @ X == np.array(b_eq))
+    if b_ineq:
+        A_ineq = sp.csr_matrix((ineq_vals, (ineq_rows, ineq_cols)), shape=(len(b_ineq), num_cols))
+        constraints.append(A_ineq @ X <= np.array(b_ineq))
+    if bound_cols:
+        bound_cols = np.array(bound_cols)
+        constraints.append(X[bound_cols] >= np.array(lower_bounds))
+        constraints.append(X[bound_cols] <= np.array(upper_bounds))
+    
+    # Squared deviation from initial values
+    deviation = X[:num_params] - np.array(x0, dtype=float)
+    objective_expr = cp.sum(cp.multiply(np.array(weights), cp.square(deviation)))
+    
+    # Heavily penalize any gap between connected parts
+    if violation_cols:
+        v_cols = np.array([v_col + d for v_col, _ in violation_cols for d in range(3)])
+        objective_expr = objective_expr + constraint_weight * cp.sum_squares(X[v_cols])
 
-    objective = cp.Minimize(cp.sum(objective_terms))
+    objective = cp.Minimize(objective_expr)
     
     # =========================================================================
     # STEP 6: Solve
@@ -261,11 +268,11 @@ def solve_constraints(beams: List[BeamBase],
     problem = cp.Problem(objective, constraints)
     
     try:
-        problem.solve(solver=cp.CLARABEL, verbose=verbose)
+        problem.solve(solver=cp.CLARABEL, verbose=verbose, canon_backend=_CANON_BACKEND)
     except Exception as e:
         raise SolverError(f"Solver failed: {e}")
     
-    if problem.status not in ['optimal', 'optimal_inaccurate']:
+    if problem.status not in _OK_STATUSES:
         raise SolverError(f"Problem infeasible or unbounded. Status: {problem.status}")
     
     if verbose:
@@ -275,11 +282,13 @@ def solve_constraints(beams: List[BeamBase],
     # =========================================================================
     # STEP 7: Update beam parameters
     # =========================================================================
+    solution = X.value
+    
     for beam_idx, beam in enumerate(beams):
         solved_params = {}
         
-        for param_name, var in cvxpy_vars_list[beam_idx].items():
-            solved_params[param_name] = float(var.value)
+        for param_name, col in var_cols_list[beam_idx].items():
+            solved_params[param_name] = float(solution[col])
         
         beam.set_parameters(solved_params)
         
@@ -289,42 +298,44 @@ def solve_constraints(beams: List[BeamBase],
     return beams
 
 
-def _evaluate_constraint_point(eq: ConstraintEquation,
-                               beam: BeamBase,
-                               cvxpy_vars: Dict,
-                               slack_vars: Dict) -> np.ndarray:
+def _linearize_constraint_point(eq: ConstraintEquation,
+                                beam: BeamBase,
+                                params: Dict[str, float],
+                                var_cols: Dict[str, int],
+                                slack_cols: Dict[str, int]) -> Tuple[List[Dict[int, float]], np.ndarray]:
     """
-    Evaluate a constraint equation to get a 3D point in GLOBAL coordinates.
-    
-    Uses beam's dual-mode geometry methods.
+    Linearize a constraint equation's 3D point in GLOBAL coordinates.
     
     Args:
         eq: ConstraintEquation with x_expr, y_expr, z_expr
         beam: Beam object
-        cvxpy_vars: Dict of CVXPY variables for this beam
-        slack_vars: Dict of slack variables for this constraint pair
+        params: Current parameter values of the beam (get_parameters()['values'])
+        var_cols: Column of X for each of this beam's variables
+        slack_cols: Column of X for each slack of this constraint (e.g. {'slack_0': 42})
     
     Returns:
-        np.ndarray of CVXPY expressions: [x_global, y_global, z_global]
+        (rows, constant): p_global[d] == constant[d] + sum(rows[d][col] * X[col])
     """
-    params = beam.get_parameters()['values']
+    var_names = list(var_cols)
+    slack_names = list(slack_cols)
+    columns = {**var_cols, **slack_cols}
     
-    # Evaluate expressions in local coordinates
-    p_local_x = evaluate_expression(eq.x_expr, params, cvxpy_vars, slack_vars)
-    p_local_y = evaluate_expression(eq.y_expr, params, cvxpy_vars, slack_vars)
-    p_local_z = evaluate_expression(eq.z_expr, params, cvxpy_vars, slack_vars)
-    
-    p_local = np.array([p_local_x, p_local_y, p_local_z])
+    # Linearize expressions in local coordinates
+    local = [linearize_expression(expr, params, var_names, slack_names)
+             for expr in (eq.x_expr, eq.y_expr, eq.z_expr)]
     
     # Transform to global using beam's rotation (theta_z is constant)
     R = beam._rotation_matrix(beam.theta_z)
-    p_rotated = R @ p_local
-    
-    # Translate using CVXPY position variables
-    p_global = np.array([
-        cvxpy_vars['x'],
-        cvxpy_vars['y'],
-        cvxpy_vars['z']
-    ]) + p_rotated
-    
-    return p_global
\ No newline at end of file
+    constant = R @ np.array([c for _, c in local])
+    
+    rows = []
+    for d, pos_key in enumerate(_POSITION_KEYS):
+        # Translate using position variables
+        row = {var_cols[pos_key]: 1.0}
+        for k, (coeffs, _) in enumerate(local):
+            for name, val in coeffs.items():
+                col = columns[name]
+                row[col] = row.get(col, 0.0) + R[d, k] * val
+        rows.append(row)
+    
+    return rows, constant
@@ -31,83 +31,63 @@ def get_profile_points(projected_length, steepness, height,
                        notch_x_mittel, notch_mittel_depth,
                        notch_x_fuss, notch_fuss_depth,
                        notch_top_length, notch_top_cut_depth):
+    """Returns the closed profile as a (13, 2) array of (x, z) points."""
     
     L = projected_length
     m = steepness
     H = height
     
-    # Line equations
-    def bottom_z(x): return -m * x - H
-    def top_z(x): return -m * x
-    
-    # Helper to find X on bottom line given Z
-    # z = -mx - H  =>  mx = -H - z  =>  x = (-H - z) / m
-    def bottom_x_from_z(z): return (-H - z) / m
+    # Line equations:
+    #   bottom line  z = -m*x - H
+    #   top line     z = -m*x
+    # X on bottom line given Z:  x = (-H - z) / m
+    z_fuss_bottom = -m * notch_x_fuss - H
+    z_fuss_shelf = z_fuss_bottom + notch_fuss_depth
+    z_mittel_bottom = -m * notch_x_mittel - H
+    z_mittel_shelf = z_mittel_bottom + notch_mittel_depth
+    # The top shelf height is defined relative to H
+    z_top_shelf = -H + notch_top_cut_depth
 
-    pts = []
+    pts = np.empty((13, 2))
     
     # 1. RIDGE TOP
-    pts.append((0, 0))
+    pts[0] = 0, 0
     
     # 2. EAVES TOP
-    pts.append((L, top_z(L)))
+    pts[1] = L, -m * L
     
     # 3. EAVES BOTTOM
-    pts.append((L, bottom_z(L)))
+    pts[2] = L, -m * L - H
     
     # 4. WALK BACK UP THE BOTTOM LINE
     
     # --- FUSS NOTCH (Lower) ---
-    # Point 1: On bottom line at x_fuss
-    z_fuss_bottom = bottom_z(notch_x_fuss)
-    pts.append((notch_x_fuss, z_fuss_bottom))
-    
-    # Point 2: Vertical Face UP (The Corner)
-    z_fuss_shelf = z_fuss_bottom + notch_fuss_depth
-    pts.append((notch_x_fuss, z_fuss_shelf))
-    
-    # Point 3: Horizontal intersection with bottom line
-    x_fuss_back = bottom_x_from_z(z_fuss_shelf)
-    pts.append((x_fuss_back, z_fuss_shelf))
+    pts[3] = notch_x_fuss, z_fuss_bottom                 # On bottom line at x_fuss
+    pts[4] = notch_x_fuss, z_fuss_shelf                  # Vertical Face UP (The Corner)
+    pts[5] = (-H - z_fuss_shelf) / m, z_fuss_shelf       # Horizontal intersection with bottom line
     
     # --- MITTEL NOTCH (Middle) ---
-    # Point 1: On bottom line at x_mittel
-    z_mittel_bottom = bottom_z(notch_x_mittel)
-    pts.append((notch_x_mittel, z_mittel_bottom))
-    
-    # Point 2: Vertical Face UP
-    z_mittel_shelf = z_mittel_bottom + notch_mittel_depth
-    pts.append((notch_x_mittel, z_mittel_shelf))
-    
-    # Point 3: Horizontal intersection
-    x_mittel_back = bottom_x_from_z(z_mittel_shelf)
-    pts.append((x_mittel_back, z_mittel_shelf))
+    pts[6] = notch_x_mittel, z_mittel_bottom             # On bottom line at x_mittel
+    pts[7] = notch_x_mittel, z_mittel_shelf              # Vertical Face UP
+    pts[8] = (-H - z_mittel_shelf) / m, z_mittel_shelf   # Horizontal intersection
     
     # --- TOP NOTCH (Ridge) ---
-    # Point 1: On bottom line at notch_top_length
-    z_top_bottom = bottom_z(notch_top_length)
-    pts.append((notch_top_length, z_top_bottom))
-    
-    # Point 2: Vertical Face UP (Right angle corner)
-    # The shelf height is defined relative to H
-    z_top_shelf = -H + notch_top_cut_depth
-    pts.append((notch_top_length, z_top_shelf))
-    
-    # Point 3: Horizontal to Ridge (x=0)
-    pts.append((0, z_top_shelf))
+    pts[9] = notch_top_length, -m * notch_top_length - H  # On bottom line at notch_top_length
+    pts[10] = notch_top_length, z_top_shelf               # Vertical Face UP (Right angle corner)
+    pts[11] = 0, z_top_shelf                              # Horizontal to Ridge (x=0)
     
     # Close shape
-    pts.append((0, 0))
+    pts[12] = 0, 0
     
     return pts
 
-# Generate points
-profile_pts = get_profile_points(
+# Generate points (build123d wants a sequence of tuples)
+profile_pts = [tuple(p) for p in get_profile_points(
     projected_length, steepness, height,
     notch_x_mittel, notch_mittel_depth,
     notch_x_fuss, notch_fuss_depth,
     notch_top_length, notch_top_cut_depth
-)
+)]
 
 # %%
 # === STEP 1: VERIFY 2D PROFILE ===
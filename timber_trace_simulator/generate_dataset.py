@@ -3,11 +3,22 @@
 Command-line interface for generating training datasets.
 """
 
+import sys
 import argparse
+import logging
 from scene_generator import generate_scenes
 from structure_blueprints import simple_structures
 from structure_blueprints import pfettendach
 
+# Blueprint name (CLI choice) -> blueprint function
+BLUEPRINTS = {
+    'post_and_beam': simple_structures.post_and_beam,
+    'sparren_on_pfette_on_pfosten': simple_structures.sparren_on_pfette_on_pfosten,
+    'half_pfettendach': simple_structures.half_pfettendach,
+    'pfettendach': pfettendach.create_pfettendach,
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate constraint-based timber structure dataset"
@@ -17,7 +28,7 @@ def main():
         '--blueprint',
         type=str,
         default='post_and_beam',
-        choices=['post_and_beam', 'two_posts_only', 'sparren_on_pfette_on_pfosten', 'half_pfettendach', 'pfettendach'],
+        choices=list(BLUEPRINTS),
         help='Structure blueprint to use'
     )
     
@@ -48,6 +59,13 @@ def main():
         help='Print detailed solver output'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes for scene generation (default: 1 = serial)'
+    )
+
     # Flag for pre-solve export
     parser.add_argument(
         '--export-presolve',
@@ -57,28 +75,23 @@ def main():
     
     args = parser.parse_args()
     
+    # Per-scene warnings go through logging; --verbose also shows DEBUG details (e.g. bad params).
+    # The root logger stays at WARNING so libraries (build123d logs every builder context at INFO)
+    # stay quiet; only this package's loggers are raised.
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logging.getLogger("scene_generator").setLevel(logging.DEBUG if args.verbose else logging.INFO)
+    
     # === INTERACTIVE PROMPT ===
     # If the user didn't specify the flag, ask them interactively
+    # (only on a terminal - headless batch runs would block on input() forever)
     export_presolve = args.export_presolve
-    if not export_presolve:
+    if not export_presolve and sys.stdin.isatty():
         print("\nDEBUG OPTION:")
         user_input = input("Also Export Scene before constraint solving ? (y)es or (n)o > ").strip().lower()
         if user_input.startswith('y'):
             export_presolve = True
 
-    # Get blueprint function
-    if args.blueprint == 'post_and_beam':
-        blueprint_func = simple_structures.post_and_beam
-    elif args.blueprint == 'two_posts_only':
-        blueprint_func = getattr(simple_structures, 'two_posts_only', None)
-    elif args.blueprint == 'sparren_on_pfette_on_pfosten':
-        blueprint_func = simple_structures.sparren_on_pfette_on_pfosten
-    elif args.blueprint == 'half_pfettendach':
-        blueprint_func = simple_structures.half_pfettendach
-    elif args.blueprint == 'pfettendach':
-        blueprint_func = pfettendach.create_pfettendach
-    else:
-        raise ValueError(f"Unknown blueprint: {args.blueprint}")
+    blueprint_func = BLUEPRINTS[args.blueprint]
     
     print("="*80)
     print("TIMBER TRACE - Constraint-Based Dataset Generator")
@@ -88,6 +101,7 @@ def main():
     print(f"Output dir:    {args.output_dir}")
     print(f"Perturbation:  ±{args.perturbation*100:.1f}%")
     print(f"Export Pre:    {export_presolve}")
+    print(f"Workers:       {args.workers}")
     print("="*80)
     
     # Generate dataset
@@ -97,7 +111,8 @@ def main():
         output_dir=args.output_dir,
         perturbation_scale=args.perturbation,
         solver_verbose=args.verbose,
-        export_presolve=export_presolve
+        export_presolve=export_presolve,
+        num_workers=args.workers
     )
 
 
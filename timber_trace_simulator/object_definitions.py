@@ -10,26 +10,26 @@ DUAL-MODE GEOMETRY: All geometry methods work with both:
 This ensures SINGLE SOURCE OF TRUTH for geometry.
 """
 
+import sys
+import math
+import importlib.util
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Optional, Union
 from dataclasses import dataclass
 
-try:
-    from build123d import (
-        Box, Part, Location, Rotation, Align, 
-        BuildPart, BuildSketch, BuildLine, Polyline, make_face, extrude, Plane
-    )
-    BUILD123D_AVAILABLE = True
-except ImportError:
-    BUILD123D_AVAILABLE = False
-    print("⚠️  build123d not available - get_model() will fail")
+# build123d is imported lazily inside the model builders: solver-only code paths
+# (constraints, parameters) never pay its import time. find_spec does not import it.
+BUILD123D_AVAILABLE = importlib.util.find_spec("build123d") is not None
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConstraintEquation:
     """
     Represents a 3D constraint as three linear expressions.
     Formulated in LOCAL coordinates (Meters), transformed to global during solving.
+    Immutable, so one instance is shared by every beam of a class (see _CONSTRAINT_TABLE).
     
     Expressions are STRING templates that will be evaluated with either:
       - Numerical values (self.x, self.height, etc.)
@@ -39,11 +39,79 @@ class ConstraintEquation:
     y_expr: str  
     z_expr: str
     slack_count: int  # 0=point, 1=line, 2=plane
+    
+    def __post_init__(self):
+        # Intern expressions so equal templates (e.g. "slack_0", "self.height") are one object
+        # process-wide; string-keyed caches downstream then match by identity first.
+        for field_name in ('x_expr', 'y_expr', 'z_expr'):
+            object.__setattr__(self, field_name, sys.intern(getattr(self, field_name)))
+
+
+# Fixed part of a Z-rotation ([[c, -s, 0], [s, c, 0], [0, 0, 1]]); only the trig slots are filled per angle
+_ROT_TEMPLATE = np.eye(3)
+
+
+@lru_cache(maxsize=64)
+def _rot_z(theta_z_val: float) -> np.ndarray:
+    """
+    Read-only Z-rotation matrix, shared by all beams with the same theta_z.
+    Keyed on the exact angle, so the matrix does not depend on which beam asked first.
+    """
+    # math.* on a Python scalar avoids NumPy's ufunc dispatch
+    c = math.cos(theta_z_val)
+    s = math.sin(theta_z_val)
+    R = _ROT_TEMPLATE.copy()
+    R[0, 0] = c; R[0, 1] = -s
+    R[1, 0] = s; R[1, 1] = c
+    R.flags.writeable = False  # Shared between callers
+    return R
+
+
+def _frozen_metadata(defaults: Dict[str, float]) -> Mapping[str, Mapping[str, float]]:
+    """Read-only per-parameter metadata ({'default', 'ai_scale'}) shared by all instances of a class"""
+    return MappingProxyType({key: MappingProxyType({'default': default, 'ai_scale': 1.0})
+                             for key, default in defaults.items()})
 
 
 class BeamBase:
     """Base class enforcing interface from Object_Centered_Framework_spec.md"""
     
+    # Fixed attribute layout: no per-instance __dict__, faster parameter access.
+    # Subclasses list their morphology parameters in their own __slots__.
+    __slots__ = ('theta_z', 'x', 'y', 'z')
+    
+    # Parameters that define the unplaced solid, in _build_model argument order
+    _MODEL_KEYS: Tuple[str, ...] = ()
+    
+    # All parameter attributes (__slots__ along the MRO, pose first) in get_parameters order,
+    # and the same names as a set for set_parameters
+    _PARAM_KEYS: Tuple[str, ...] = __slots__
+    _SETTABLE: frozenset = frozenset(__slots__)
+    
+    # Parameter metadata, identical for every instance -> built once per class, read-only
+    _POSE_KEYS: Tuple[str, ...] = ('theta_z', 'x', 'y', 'z')
+    _MORPHOLOGY_KEYS: Tuple[str, ...] = ()
+    _DEFAULTS: Tuple[Tuple[str, float], ...] = ()  # (morphology name, default) pairs
+    _METADATA: Mapping[str, Mapping[str, float]] = MappingProxyType({})
+    _BOUNDS: Mapping[str, Tuple[float, float]] = MappingProxyType({})
+    
+    # LOCAL face direction -> constraint equations on that face.
+    # Expressions reference parameters symbolically, so one table serves all instances.
+    _CONSTRAINT_TABLE: Dict[int, Tuple[ConstraintEquation, ...]] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        """Derive the per-class parameter wiring once, at class creation"""
+        super().__init_subclass__(**kwargs)
+        cls._PARAM_KEYS = tuple(name for klass in reversed(cls.__mro__)
+                                for name in klass.__dict__.get('__slots__', ()))
+        cls._SETTABLE = frozenset(cls._PARAM_KEYS)
+        
+        # Pose parameters default to 0.0, morphology defaults come from _DEFAULTS
+        defaults = dict.fromkeys(cls._POSE_KEYS, 0.0)
+        defaults.update(cls._DEFAULTS)
+        cls._METADATA = _frozen_metadata({key: defaults[key]
+                                          for key in cls._POSE_KEYS + cls._MORPHOLOGY_KEYS})
+    
     def __init__(self):
         # Index 0: Rotation (constant during solving)
         self.theta_z = 0.0  # radians
@@ -61,13 +129,18 @@ class BeamBase:
         Returns 3D rotation matrix for Z-axis rotation.
         ALWAYS takes numerical value (not CVXPY variable).
         """
-        c = np.cos(theta_z_val)
-        s = np.sin(theta_z_val)
-        return np.array([
-            [c, -s, 0],
-            [s,  c, 0],
-            [0,  0, 1]
-        ])
+        # theta_z is constant during solving and shared by many beams -> cache per angle
+        return _rot_z(float(theta_z_val))
+    
+    # Global direction -> local direction, one row per Z-rotation quadrant (0/90/180/270 deg).
+    # Row q is the inverse of rotating the local axes by q*90 deg CCW
+    # (e.g. at 90 deg Local X+ -> Global Y+, so Global Front(2) -> Local Right(0)).
+    _DIR_TABLE = (
+        (0, 1, 2, 3, 4, 5),  # ~0 deg   (Identity)
+        (3, 2, 0, 1, 4, 5),  # ~90 deg  (Global Front -> Local Right)
+        (1, 0, 3, 2, 4, 5),  # ~180 deg (Global Front -> Local Back)
+        (2, 3, 1, 0, 4, 5),  # ~270 deg (Global Front -> Local Left)
+    )
     
     def map_global_to_local_direction(self, global_dir: int, theta_z: float) -> int:
         """
@@ -80,47 +153,13 @@ class BeamBase:
           3: Back  (-Y)
           4: Top   (+Z)
           5: Bottom(-Z)
-        """
-        # Z-axis directions never change
-        if global_dir >= 4:
-            return global_dir
-            
-        # Normalize angle to 0-360 degrees
-        deg = np.degrees(theta_z) % 360
         
-        # 4 Separate Cases as requested
-        # Case 1: ~0 degrees (Identity)
-        if (deg >= 315 or deg < 45):
-            return global_dir
-            
-        # Case 2: ~90 degrees (Global Front -> Local Right)
-        # Rotated 90 deg CCW: Local X+ -> Global Y+
-        elif (deg >= 45 and deg < 135):
-            if global_dir == 2: return 0 # G Front -> L Right
-            if global_dir == 0: return 3 # G Right -> L Back
-            if global_dir == 3: return 1 # G Back  -> L Left
-            if global_dir == 1: return 2 # G Left  -> L Front
-            
-        # Case 3: ~180 degrees (Global Front -> Local Back)
-        elif (deg >= 135 and deg < 225):
-            if global_dir == 2: return 3 # G Front -> L Back
-            if global_dir == 3: return 2 # G Back  -> L Front
-            if global_dir == 0: return 1 # G Right -> L Left
-            if global_dir == 1: return 0 # G Left  -> L Right
-            
-        # Case 4: ~270 degrees (Global Front -> Local Left)
-        elif (deg >= 225 and deg < 315):
-            if global_dir == 2: return 1 # G Front -> L Left
-            if global_dir == 1: return 0 # G Left  -> L Right
-            if global_dir == 0: return 2 # G Right -> L Front
-            if global_dir == 3: return 0 # G Back  -> L Right (Correction: L Back -> G Right at 270) -> Wait.
-            # Let's verify 270 mapping:
-            # L Right (+X) -> G Back (-Y). So G Back -> L Right. Correct.
-            return {0: 2, 1: 0, 2: 1, 3: 0}[global_dir] # Fixed mapping dict for 270
-
-        return global_dir # Fallback
+        theta_z is snapped to the nearest quadrant (boundaries at 45/135/225/315 deg).
+        """
+        quadrant = int(math.floor(theta_z * (2.0 / math.pi) + 0.5)) & 3
+        return self._DIR_TABLE[quadrant][global_dir]
 
-    def get_constraints(self, direction: int, index: Optional[int] = None) -> Union[List[ConstraintEquation], ConstraintEquation]:
+    def get_constraints(self, direction: int, index: Optional[int] = None) -> Union[Tuple[ConstraintEquation, ...], ConstraintEquation]:
         """
         Returns constraint equations for specified face.
         
@@ -131,33 +170,60 @@ class BeamBase:
                        4 = Top,   5 = Bottom
             index: If None, return all constraints for this face.
                    If int, return only constraint at that index.
+        
+        Looks up the subclass's _CONSTRAINT_TABLE (LOCAL face -> equations).
         """
-        raise NotImplementedError
+        local_dir = self.map_global_to_local_direction(direction, self.theta_z)
+        constraints = self._CONSTRAINT_TABLE.get(local_dir)
+        if constraints is None:
+            raise NotImplementedError(f"{type(self).__name__}: Face {local_dir} not implemented")
+        return constraints[index] if index is not None else constraints
     
     def get_parameters(self) -> Dict:
         """Returns current parameters + metadata"""
-        raise NotImplementedError
+        return {
+            'values': {key: getattr(self, key) for key in self._PARAM_KEYS},
+            'metadata': self._METADATA,
+            'morphology_keys': self._MORPHOLOGY_KEYS,
+            'pose_keys': self._POSE_KEYS
+        }
     
     def set_parameters(self, params: Dict[str, float]):
-        """Update beam parameters"""
+        """Update beam parameters (unknown keys are ignored)"""
+        settable = self._SETTABLE
         for key, value in params.items():
-            if hasattr(self, key):
+            if key in settable:
                 setattr(self, key, value)
     
-    def get_parameter_bounds(self) -> Dict[str, Tuple[float, float]]:
-        """Returns min/max bounds for each parameter"""
-        raise NotImplementedError
+    def get_parameter_bounds(self) -> Mapping[str, Tuple[float, float]]:
+        """Returns min/max bounds for each parameter (shared, read-only)"""
+        return self._BOUNDS
     
-    def get_inequality_constraints(self) -> List[Tuple[str, str]]:
+    def get_inequality_constraints(self) -> Tuple[Tuple[str, str], ...]:
         """
-        Returns a list of inequality constraints strings (LHS <= RHS).
-        Format: [("self.param_a", "self.param_b - 0.1"), ...]
+        Returns inequality constraint strings (LHS <= RHS).
+        Format: (("self.param_a", "self.param_b - 0.1"), ...)
         """
-        return []
+        return ()
+
+    @staticmethod
+    def _build_model(*dims: float) -> 'Part':
+        """Build the unplaced solid in LOCAL coordinates from _MODEL_KEYS values"""
+        raise NotImplementedError
 
     def get_model(self) -> 'Part':
         """Generate 3D solid model from current parameters"""
-        raise NotImplementedError
+        if not BUILD123D_AVAILABLE:
+            raise ImportError("build123d required")
+        from build123d import Location, Rotation
+        
+        # Unplaced solid from the morphology, then placed at the beam's pose
+        dims = tuple(float(getattr(self, key)) for key in self._MODEL_KEYS)
+        
+        # Apply rotation and translation - SAME as constraint equations
+        loc = Location((self.x, self.y, self.z)) * Rotation(0, 0, math.degrees(self.theta_z))
+        
+        return self._build_model(*dims).moved(loc)
 
 
 class Pfosten(BeamBase):
@@ -168,6 +234,28 @@ class Pfosten(BeamBase):
     SIMPLIFIED: Only top face constraint implemented (center point).
     """
     
+    __slots__ = ('width', 'depth', 'height')
+    
+    _MODEL_KEYS = ('width', 'depth', 'height')
+    
+    _MORPHOLOGY_KEYS = ('width', 'depth', 'height')
+    _DEFAULTS = (('width', 0.1), ('depth', 0.1), ('height', 2.2))
+    _BOUNDS = MappingProxyType({
+        'x': (-50.0, 50.0),      # m
+        'y': (-50.0, 50.0),      # m
+        'z': (0.0, 20.0),        # m
+        'theta_z': (0, 2*np.pi),
+        'width': (0.05, 0.3),    # 5cm to 30cm
+        'depth': (0.05, 0.3),
+        'height': (1.0, 5.0),    # 1m to 5m
+    })
+    
+    # SIMPLIFIED: Only top face (direction=4) implemented.
+    _CONSTRAINT_TABLE = {
+        # Single constraint: center point of top face (no slacks)
+        4: (ConstraintEquation("0", "0", "self.height", slack_count=0),),
+    }
+    
     def __init__(self, width: float = 0.1, depth: float = 0.1, height: float = 2.2):
         super().__init__()
         self.width = width    # m (X-direction in local coords)
@@ -193,78 +281,18 @@ class Pfosten(BeamBase):
         z_val = z if z is not None else self.z
         height_val = height if height is not None else self.height
         
-        # Local coordinates: center of top face
-        p_local = np.array([0.0, 0.0, height_val])
-        
-        # Rotate using CURRENT theta_z (always numerical, not optimized)
-        R = self._rotation_matrix(self.theta_z)
-        
-        # Matrix-vector multiply works with both numbers and CVXPY vars
-        p_rotated = R @ p_local
-        
-        # Translate to global position
-        p_global = np.array([x_val, y_val, z_val]) + p_rotated
+        # Local coordinates: center of top face = (0, 0, height).
+        # It lies on the Z-axis, so the Z-rotation (theta_z) leaves it unchanged
+        # and only the translation to the global position remains.
+        p_global = np.array([x_val, y_val, z_val + height_val])
         
         return p_global
     
-    def get_constraints(self, direction: int, index: Optional[int] = None) -> Union[List[ConstraintEquation], ConstraintEquation]:
-        """
-        SIMPLIFIED: Only top face (direction=4) implemented.
-        Returns single constraint equation (center point, no slacks).
-        """
-        local_dir = self.map_global_to_local_direction(direction, self.theta_z)
-        if local_dir == 4:  # Top face
-            # Single constraint: center point of top face
-            constraints = [ConstraintEquation("0", "0", "self.height", slack_count=0)]
-            return constraints[0] if index == 0 else constraints
-        else:
-            # Other faces not implemented for now
-            raise NotImplementedError(f"Pfosten: Only top face (direction=4) implemented, got {local_dir}")
-    
-    def get_parameters(self) -> Dict:
-        return {
-            'values': {
-                'theta_z': self.theta_z,
-                'x': self.x, 'y': self.y, 'z': self.z,
-                'width': self.width, 'depth': self.depth, 'height': self.height,
-            },
-            'metadata': {
-                'theta_z': {'default': 0.0, 'ai_scale': 1.0},
-                'x': {'default': 0.0, 'ai_scale': 1.0},
-                'y': {'default': 0.0, 'ai_scale': 1.0},
-                'z': {'default': 0.0, 'ai_scale': 1.0},
-                'width': {'default': 0.1, 'ai_scale': 1.0},
-                'depth': {'default': 0.1, 'ai_scale': 1.0},
-                'height': {'default': 2.2, 'ai_scale': 1.0},
-            },
-            'morphology_keys': ['width', 'depth', 'height'],
-            'pose_keys': ['theta_z', 'x', 'y', 'z']
-        }
-    
-    def get_parameter_bounds(self) -> Dict[str, Tuple[float, float]]:
-        return {
-            'x': (-50.0, 50.0),      # m
-            'y': (-50.0, 50.0),      # m
-            'z': (0.0, 20.0),        # m
-            'theta_z': (0, 2*np.pi),
-            'width': (0.05, 0.3),    # 5cm to 30cm
-            'depth': (0.05, 0.3),
-            'height': (1.0, 5.0),    # 1m to 5m
-        }
-    
-    def get_model(self) -> 'Part':
-        """Generate build123d model using SAME geometry logic"""
-        if not BUILD123D_AVAILABLE: 
-            raise ImportError("build123d required")
-        
-        # Create box centered at origin
-        box = Box(self.width, self.depth, self.height, 
-                 align=(Align.CENTER, Align.CENTER, Align.MIN))
-        
-        # Apply rotation and translation - SAME as constraint equations
-        loc = Location((self.x, self.y, self.z)) * Rotation(0, 0, np.degrees(self.theta_z))
-        
-        return box.move(loc)
+    @staticmethod
+    def _build_model(width: float, depth: float, height: float) -> 'Part':
+        """Box centered in X/Y, base on Z=0 - SAME geometry as constraint equations"""
+        from build123d import Box, Align
+        return Box(width, depth, height, align=(Align.CENTER, Align.CENTER, Align.MIN))
 
 
 class Pfette(BeamBase):
@@ -273,86 +301,95 @@ class Pfette(BeamBase):
     Y-AXIS ALIGNED: Length is along Y, Width is along X.
     """
     
+    __slots__ = ('length', 'width', 'height')
+    
+    # NOTE: Box dimensions swapped! X=Width, Y=Length
+    _MODEL_KEYS = ('width', 'length', 'height')
+    
+    _MORPHOLOGY_KEYS = ('length', 'width', 'height')
+    _DEFAULTS = (('length', 6.0), ('width', 0.12), ('height', 0.16))
+    _BOUNDS = MappingProxyType({
+        'x': (-50.0, 50.0), 'y': (-50.0, 50.0), 'z': (0.0, 20.0), 'theta_z': (0, 6.28),
+        'length': (1.0, 15.0), 'width': (0.08, 0.3), 'height': (0.1, 0.4),
+    })
+    
+    # Y-aligned: lines/faces run along the length (local Y)
+    _CONSTRAINT_TABLE = {
+        # Top (4) / Bottom (5) - Line along Y-axis (slack_0 defines Y position)
+        4: (ConstraintEquation("0", "slack_0", "self.height", slack_count=1),),
+        5: (ConstraintEquation("0", "slack_0", "0", slack_count=1),),
+        # Sides Right (0, +X) / Left (1, -X) - Plane (slack_count=2)
+        # Allows contact at any Z height (fixing the infeasibility) and any Y position
+        0: (ConstraintEquation("self.width/2", "slack_0", "slack_1", slack_count=2),),
+        1: (ConstraintEquation("-self.width/2", "slack_0", "slack_1", slack_count=2),),
+        # Ends Front (2, +Y) / Back (3, -Y) - Center point of the vertical end faces
+        2: (ConstraintEquation("0", "self.length/2", "self.height/2", slack_count=0),),
+        3: (ConstraintEquation("0", "-self.length/2", "self.height/2", slack_count=0),),
+    }
+    
     def __init__(self, length: float = 6.0, width: float = 0.12, height: float = 0.16):
         super().__init__()
         self.length = length  # Y-direction (Global Front/Back)
         self.width = width    # X-direction (Global Right/Left)
         self.height = height  # Z-direction
     
-    def get_constraints(self, direction: int, index: Optional[int] = None) -> Union[List[ConstraintEquation], ConstraintEquation]:
-        """
-        Constraints for Y-Aligned Pfette:
-          Top (4)    -> Line along Y-axis (Length)
-          Bottom (5) -> Line along Y-axis
-          Right (0)  -> Line along Y-axis (Side Face at X = +width/2)
-          Left (1)   -> Line along Y-axis (Side Face at X = -width/2)
-          Front (2)  -> Face at Y = +length/2
-          Back (3)   -> Face at Y = -length/2
-        """
-        local_dir = self.map_global_to_local_direction(direction, self.theta_z)
-        constraints = []
-        
-        # --- TOP (4) & BOTTOM (5) ---
-        # Line along Y-axis (slack_0 defines Y position)
-        if local_dir == 4:  # Top
-            constraints.append(ConstraintEquation("0", "slack_0", "self.height", slack_count=1))
-        elif local_dir == 5:  # Bottom
-            constraints.append(ConstraintEquation("0", "slack_0", "0", slack_count=1))
-            
-        # Sides (Right/Left): Plane (slack_count=2)
-        # Allows contact at any Z height (fixing the infeasibility) and any Y position
-        elif local_dir == 0:  # Right (+X)
-            constraints.append(ConstraintEquation("self.width/2", "slack_0", "slack_1", slack_count=2))
-        elif local_dir == 1:  # Left (-X)
-            constraints.append(ConstraintEquation("-self.width/2", "slack_0", "slack_1", slack_count=2))
-            
-        # --- ENDS (FRONT 2 / BACK 3) ---
-        # Vertical faces at Y ends.
-        elif local_dir == 2:  # Front (+Y)
-            constraints.append(ConstraintEquation("0", "self.length/2", "self.height/2", slack_count=0))
-        elif local_dir == 3:  # Back (-Y)
-            constraints.append(ConstraintEquation("0", "-self.length/2", "self.height/2", slack_count=0))
-            
-        else:
-            raise NotImplementedError(f"Pfette: Face {direction} not implemented")
-            
-        return constraints[0] if index == 0 else constraints
+    @staticmethod
+    def _build_model(width: float, length: float, height: float) -> 'Part':
+        from build123d import Box, Align
+        return Box(width, length, height, align=(Align.CENTER, Align.CENTER, Align.MIN))
     
-    def get_parameters(self) -> Dict:
-        return {
-            'values': {
-                'theta_z': self.theta_z,
-                'x': self.x, 'y': self.y, 'z': self.z,
-                'length': self.length, 'width': self.width, 'height': self.height,
-            },
-            'metadata': {
-                'theta_z': {'default': 0.0, 'ai_scale': 1.0},
-                'x': {'default': 0.0, 'ai_scale': 1.0},
-                'y': {'default': 0.0, 'ai_scale': 1.0},
-                'z': {'default': 0.0, 'ai_scale': 1.0},
-                'length': {'default': 6.0, 'ai_scale': 1.0},
-                'width': {'default': 0.12, 'ai_scale': 1.0},
-                'height': {'default': 0.16, 'ai_scale': 1.0},
-            },
-            'morphology_keys': ['length', 'width', 'height'],
-            'pose_keys': ['theta_z', 'x', 'y', 'z']
-        }
+
+class Sparren(BeamBase):
+    __slots__ = ('width', 'height', 'projected_length', 'steepness',
+                 'notch_x_mittel', 'notch_mittel_depth', 'notch_x_fuss', 'notch_fuss_depth',
+                 'notch_top_length', 'notch_top_cut_depth')
     
-    def get_parameter_bounds(self) -> Dict[str, Tuple[float, float]]:
-        return {
-            'x': (-50.0, 50.0), 'y': (-50.0, 50.0), 'z': (0.0, 20.0), 'theta_z': (0, 6.28),
-            'length': (1.0, 15.0), 'width': (0.08, 0.3), 'height': (0.1, 0.4),
-        }
+    _MODEL_KEYS = ('width', 'height', 'projected_length', 'steepness',
+                   'notch_x_mittel', 'notch_mittel_depth', 'notch_x_fuss', 'notch_fuss_depth',
+                   'notch_top_length', 'notch_top_cut_depth')
     
-    def get_model(self) -> 'Part':
-        if not BUILD123D_AVAILABLE: raise ImportError("build123d required")
-        # NOTE: Box dimensions swapped! X=Width, Y=Length
-        box = Box(self.width, self.length, self.height, align=(Align.CENTER, Align.CENTER, Align.MIN))
-        loc = Location((self.x, self.y, self.z)) * Rotation(0, 0, np.degrees(self.theta_z))
-        return box.move(loc)
+    # steepness is fixed by the blueprint (not optimized)
+    _MORPHOLOGY_KEYS = ('width', 'height', 'projected_length',
+                        'notch_x_mittel', 'notch_mittel_depth', 'notch_x_fuss', 'notch_fuss_depth',
+                        'notch_top_length', 'notch_top_cut_depth')
+    _DEFAULTS = (('width', 0.1), ('height', 0.16), ('projected_length', 3.0),
+                 ('notch_x_mittel', 1.5), ('notch_mittel_depth', 0.05),
+                 ('notch_x_fuss', 2.8), ('notch_fuss_depth', 0.05),
+                 ('notch_top_length', 0.08), ('notch_top_cut_depth', 0.0))
+    _BOUNDS = MappingProxyType({
+        'x': (-50, 50), 'y': (-50, 50), 'z': (0, 20), 'theta_z': (0, 6.28),
+        'width': (0.05, 0.2), 'height': (0.1, 0.3), 'projected_length': (1, 10),
+        'steepness': (0.5, 2.0), 'notch_x_mittel': (0.5, 9), 'notch_x_fuss': (0.5, 9),
+        'notch_top_length': (0.05, 0.5),
+    })
+    
+    # Safety rules (LHS <= RHS). steepness stays symbolic: it is not optimized, so the
+    # solver substitutes its current value, and the strings are the same for every instance.
+    _INEQ_CONSTRAINTS = (
+        ("self.notch_mittel_depth", "0.7 * self.height"),
+        ("self.notch_fuss_depth", "0.7 * self.height"),
+        # 0.1 m buffer between notches; x_back = notch_x - depth / steepness
+        ("self.notch_top_length + 0.1", "self.notch_x_mittel - (self.notch_mittel_depth / self.steepness)"),
+        ("self.notch_x_mittel + 0.1", "self.notch_x_fuss - (self.notch_fuss_depth / self.steepness)"),
+        ("self.notch_x_fuss + 0.1", "self.projected_length"),
+    )
+    
+    _CONSTRAINT_TABLE = {
+        # Bottom (5) - Notch shelves, lines along local X
+        5: (
+            ConstraintEquation("slack_0", "0", "-self.steepness * self.notch_x_fuss - self.height + self.notch_fuss_depth", slack_count=1),
+            ConstraintEquation("slack_0", "0", "-self.steepness * self.notch_x_mittel - self.height + self.notch_mittel_depth", slack_count=1),
+            ConstraintEquation("slack_0", "0", "-self.height + self.notch_top_cut_depth", slack_count=1),
+        ),
+        # Left (1) - Vertical Notch Faces (-X direction): planes at X = notch_x
+        1: (
+            ConstraintEquation("self.notch_x_fuss", "slack_0", "slack_1", slack_count=2),
+            ConstraintEquation("self.notch_x_mittel", "slack_0", "slack_1", slack_count=2),
+            ConstraintEquation("self.notch_top_length", "slack_0", "slack_1", slack_count=2),
+            ConstraintEquation("0", "slack_0", "slack_1", slack_count=2),
+        ),
+    }
     
-
-class Sparren(BeamBase):
     def __init__(self, width=0.1, height=0.16, projected_length=3.0, steepness=1.0,
                  notch_x_mittel=1.5, notch_mittel_depth=0.05,
                  notch_x_fuss=2.8, notch_fuss_depth=0.05,
@@ -369,102 +406,51 @@ class Sparren(BeamBase):
         self.notch_top_length = notch_top_length
         self.notch_top_cut_depth = notch_top_cut_depth
 
-    def get_constraints(self, direction: int, index: Optional[int] = None):
-        # Map Global -> Local
-        local_dir = self.map_global_to_local_direction(direction, self.theta_z)
-        
-        # Bottom (5)
-        if local_dir == 5:
-            constraints = []
-            z_fuss = "-self.steepness * self.notch_x_fuss - self.height + self.notch_fuss_depth"
-            constraints.append(ConstraintEquation("slack_0", "0", z_fuss, slack_count=1))
-            
-            z_mittel = "-self.steepness * self.notch_x_mittel - self.height + self.notch_mittel_depth"
-            constraints.append(ConstraintEquation("slack_0", "0", z_mittel, slack_count=1))
-            
-            z_top = "-self.height + self.notch_top_cut_depth"
-            constraints.append(ConstraintEquation("slack_0", "0", z_top, slack_count=1))
-            return constraints[index] if index is not None else constraints
-
-        # Left (1) - Vertical Notch Faces (-X direction)
-        elif local_dir == 1:
-            constraints = []
-            # Vertical planes at X = notch_x
-            constraints.append(ConstraintEquation("self.notch_x_fuss", "slack_0", "slack_1", slack_count=2))
-            constraints.append(ConstraintEquation("self.notch_x_mittel", "slack_0", "slack_1", slack_count=2))
-            constraints.append(ConstraintEquation("self.notch_top_length", "slack_0", "slack_1", slack_count=2))
-            constraints.append(ConstraintEquation("0", "slack_0", "slack_1", slack_count=2))
-            return constraints[index] if index is not None else constraints
-            
-        else:
-            raise NotImplementedError(f"Sparren: Face {local_dir} not implemented")
+    def get_inequality_constraints(self) -> Tuple[Tuple[str, str], ...]:
+        return self._INEQ_CONSTRAINTS
 
-    def get_inequality_constraints(self) -> List[Tuple[str, str]]:
-        constraints = []
-        constraints.append(("self.notch_mittel_depth", "0.7 * self.height"))
-        constraints.append(("self.notch_fuss_depth", "0.7 * self.height"))
+    @staticmethod
+    def _build_model(width, height, projected_length, steepness,
+                     notch_x_mittel, notch_mittel_depth, notch_x_fuss, notch_fuss_depth,
+                     notch_top_length, notch_top_cut_depth) -> 'Part':
+        from build123d import BuildPart, BuildSketch, BuildLine, Polyline, make_face, extrude, Plane
         
-        buffer = "0.1"
-        x_back_mittel = f"self.notch_x_mittel - (self.notch_mittel_depth / {self.steepness})"
-        x_back_fuss = f"self.notch_x_fuss - (self.notch_fuss_depth / {self.steepness})"
+        L, m, H = projected_length, steepness, height
         
-        constraints.append(("self.notch_top_length + " + buffer, x_back_mittel))
-        constraints.append(("self.notch_x_mittel + " + buffer, x_back_fuss))
-        constraints.append(("self.notch_x_fuss + " + buffer, "self.projected_length"))
-        return constraints
-
-    def get_parameters(self) -> Dict:
-        return {
-            'values': {'theta_z': self.theta_z, 'x': self.x, 'y': self.y, 'z': self.z,
-                       'width': self.width, 'height': self.height, 'projected_length': self.projected_length,
-                       'steepness': self.steepness, 'notch_x_mittel': self.notch_x_mittel,
-                       'notch_mittel_depth': self.notch_mittel_depth, 'notch_x_fuss': self.notch_x_fuss,
-                       'notch_fuss_depth': self.notch_fuss_depth, 'notch_top_length': self.notch_top_length,
-                       'notch_top_cut_depth': self.notch_top_cut_depth},
-            'metadata': {},
-            'morphology_keys': ['width', 'height', 'projected_length',
-                'notch_x_mittel', 'notch_mittel_depth', 'notch_x_fuss', 'notch_fuss_depth',
-                'notch_top_length', 'notch_top_cut_depth'],
-            'pose_keys': ['theta_z', 'x', 'y', 'z']
-        }
-    
-    def get_parameter_bounds(self) -> Dict:
-        return {'x': (-50, 50), 'y': (-50, 50), 'z': (0, 20), 'theta_z': (0, 6.28),
-                'width': (0.05, 0.2), 'height': (0.1, 0.3), 'projected_length': (1, 10),
-                'steepness': (0.5, 2.0), 'notch_x_mittel': (0.5, 9), 'notch_x_fuss': (0.5, 9),
-                'notch_top_length': (0.05, 0.5)}
-
-    def get_model(self) -> 'Part':
-        if not BUILD123D_AVAILABLE: raise ImportError
-        L, m, H = float(self.projected_length), float(self.steepness), float(self.height)
-        def bottom_z(x): return -m * x - H
-        def top_z(x): return -m * x
-        def bottom_x_from_z(z): return (-H - z) / m
-
-        pts = [(0.0, 0.0), (L, top_z(L)), (L, bottom_z(L))]
+        # Fuss / Mittel notches: start on the bottom line (z = -m*x - H), go up by the
+        # notch depth, then run back to the bottom line (x = (-H - z) / m)
+        notch_x = np.array([notch_x_fuss, notch_x_mittel])
+        z_bottom = -m * notch_x - H
+        z_shelf = z_bottom + np.array([notch_fuss_depth, notch_mittel_depth])
+        x_back = (-H - z_shelf) / m
         
-        z_fuss = bottom_z(self.notch_x_fuss)
-        pts.extend([(float(self.notch_x_fuss), z_fuss),
-                    (float(self.notch_x_fuss), z_fuss + self.notch_fuss_depth),
-                    (bottom_x_from_z(z_fuss + self.notch_fuss_depth), z_fuss + self.notch_fuss_depth)])
+        pts = np.empty((13, 2))
+        pts[0] = 0.0, 0.0                     # Ridge top
+        pts[1] = L, -m * L                    # Eaves top
+        pts[2] = L, -m * L - H                # Eaves bottom
         
-        z_mittel = bottom_z(self.notch_x_mittel)
-        pts.extend([(float(self.notch_x_mittel), z_mittel),
-                    (float(self.notch_x_mittel), z_mittel + self.notch_mittel_depth),
-                    (bottom_x_from_z(z_mittel + self.notch_mittel_depth), z_mittel + self.notch_mittel_depth)])
+        notches = pts[3:9].reshape(2, 3, 2)   # View: [fuss, mittel] x 3 corner points
+        notches[:, 0, 0] = notch_x
+        notches[:, 0, 1] = z_bottom
+        notches[:, 1, 0] = notch_x
+        notches[:, 1, 1] = z_shelf
+        notches[:, 2, 0] = x_back
+        notches[:, 2, 1] = z_shelf
         
-        z_top_base = bottom_z(self.notch_top_length)
-        z_top_shelf = -H + self.notch_top_cut_depth
-        pts.extend([(float(self.notch_top_length), z_top_base),
-                    (float(self.notch_top_length), z_top_shelf),
-                    (0.0, z_top_shelf), (0.0, 0.0)])
+        # Top notch: shelf height is relative to H, runs back to the ridge plane (x = 0)
+        z_top_shelf = -H + notch_top_cut_depth
+        pts[9] = notch_top_length, -m * notch_top_length - H
+        pts[10] = notch_top_length, z_top_shelf
+        pts[11] = 0.0, z_top_shelf
+        pts[12] = 0.0, 0.0
+        pts = [tuple(p) for p in pts.tolist()]
         
         with BuildPart() as p:
             with BuildSketch(Plane.XZ):
                 with BuildLine(): Polyline(pts)
                 make_face()
-            extrude(amount=self.width, both=True)
-        return p.part.move(Location((self.x, self.y, self.z)) * Rotation(0, 0, np.degrees(self.theta_z)))
+            extrude(amount=width, both=True)
+        return p.part
 
 # Type registry for easy lookup
 BEAM_TYPES = {
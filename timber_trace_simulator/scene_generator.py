@@ -8,19 +8,29 @@ physically valid, geometrically consistent datasets through constraint solving.
 
 import os
 import json
+import shutil
+import struct
+import logging
 import numpy as np
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Callable, Tuple, Optional
 from tqdm import tqdm
 
-from object_definitions import BeamBase, BEAM_NAMES
+from object_definitions import BeamBase, BEAM_TYPES, BEAM_NAMES
 from constraint_solver import solve_constraints, SolverError
 
+logger = logging.getLogger(__name__)
+
 try:
     from build123d import export_stl
     BUILD123D_AVAILABLE = True
 except ImportError:
     BUILD123D_AVAILABLE = False
-    print("⚠️  build123d not available - STL export will fail")
+    logger.warning("build123d not available - STL export will fail")
+
+# Beam class name -> semantic label (inverse of BEAM_TYPES)
+_SEMANTIC_LABELS = {beam_class.__name__: label for label, beam_class in BEAM_TYPES.items()}
 
 
 def generate_scenes(blueprint_func: Callable,
@@ -28,64 +38,38 @@ def generate_scenes(blueprint_func: Callable,
                    output_dir: str,
                    perturbation_scale: float = 0.05,
                    solver_verbose: bool = False,
-                   export_presolve: bool = False) -> None:
+                   export_presolve: bool = False,
+                   num_workers: int = 1) -> None:
     """
     Generate dataset of valid structures.
+    
+    With num_workers > 1, scenes are generated in a process pool.
     """
     os.makedirs(output_dir, exist_ok=True)
     print(f"\n🔨 Generating {num_scenes} scenes...")
     print(f"   Blueprint:    {blueprint_func.__name__}")
     print(f"   Perturbation: ±{perturbation_scale*100:.1f}%")
     print(f"   Pre-solve:    {'YES' if export_presolve else 'NO'}")
+    print(f"   Workers:      {num_workers}")
     
-    failed_scenes = []
+    run_scene = partial(
+        _generate_one_scene,
+        blueprint_func=blueprint_func,
+        output_dir=output_dir,
+        perturbation_scale=perturbation_scale,
+        solver_verbose=solver_verbose,
+        export_presolve=export_presolve
+    )
     
-    for scene_id in tqdm(range(num_scenes), desc="Generating scenes"):
-        try:
-            # =====================================================================
-            # STEP 1: Get rough structure from blueprint
-            # =====================================================================
-            beams, topology = blueprint_func(seed=scene_id)
-            
-            # =====================================================================
-            # STEP 2: Apply perturbations (Variation)
-            # =====================================================================
-            beams = _apply_perturbations(beams, perturbation_scale, seed=scene_id)
-            
-            # =====================================================================
-            # OPTIONAL: Export Pre-Solve State (Debug)
-            # =====================================================================
-            if export_presolve:
-                # We catch errors here so bad geometry doesn't stop the pipeline
-                try:
-                    _export_scene(scene_id, beams, topology, output_dir, prefix="unprocessed_")
-                except Exception as e:
-                    print(f"⚠️  Scene {scene_id}: Failed to export pre-solve state: {e}")
-
-            # =====================================================================
-            # STEP 3: Solve constraints (Enforce Validity)
-            # =====================================================================
-            try:
-                beams = solve_constraints(
-                    beams, 
-                    topology,
-                    max_adjustment=0.5,
-                    verbose=solver_verbose
-                )
-            except SolverError as e:
-                print(f"\n⚠️  Scene {scene_id}: Solver failed - {e}")
-                failed_scenes.append((scene_id, str(e)))
-                continue
-            
-            # =====================================================================
-            # STEP 4: Export Final Scene
-            # =====================================================================
-            _export_scene(scene_id, beams, topology, output_dir, prefix="")
-            
-        except Exception as e:
-            print(f"\n❌ Scene {scene_id}: Unexpected error - {e}")
-            failed_scenes.append((scene_id, str(e)))
-            continue
+    # Scenes are independent and seeded by scene_id, so results don't depend on worker count
+    if num_workers > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            results = list(tqdm(executor.map(run_scene, range(num_scenes)),
+                                total=num_scenes, desc="Generating scenes"))
+    else:
+        results = [run_scene(scene_id) for scene_id in tqdm(range(num_scenes), desc="Generating scenes")]
+    
+    failed_scenes = [r for r in results if r is not None]
     
     # =========================================================================
     # Create index file
@@ -99,6 +83,66 @@ def generate_scenes(blueprint_func: Callable,
         print(f"   See {output_dir}/failed_scenes.json for details")
 
 
+def _generate_one_scene(scene_id: int,
+                       blueprint_func: Callable,
+                       output_dir: str,
+                       perturbation_scale: float,
+                       solver_verbose: bool,
+                       export_presolve: bool) -> Optional[Tuple[int, str]]:
+    """
+    Generate, solve and export a single scene.
+    
+    Module-level so it can be pickled into worker processes.
+    
+    Returns:
+        None on success, (scene_id, error message) on failure
+    """
+    try:
+        # =====================================================================
+        # STEP 1: Get rough structure from blueprint
+        # =====================================================================
+        beams, topology = blueprint_func(seed=scene_id)
+        
+        # =====================================================================
+        # STEP 2: Apply perturbations (Variation)
+        # =====================================================================
+        beams = _apply_perturbations(beams, perturbation_scale, seed=scene_id)
+        
+        # =====================================================================
+        # OPTIONAL: Export Pre-Solve State (Debug)
+        # =====================================================================
+        if export_presolve:
+            # We catch errors here so bad geometry doesn't stop the pipeline
+            try:
+                _export_scene(scene_id, beams, topology, output_dir, prefix="unprocessed_")
+            except Exception as e:
+                logger.warning("⚠️  Scene %d: Failed to export pre-solve state: %s", scene_id, e)
+
+        # =====================================================================
+        # STEP 3: Solve constraints (Enforce Validity)
+        # =====================================================================
+        try:
+            beams = solve_constraints(
+                beams, 
+                topology,
+                max_adjustment=0.5,
+                verbose=solver_verbose
+            )
+        except SolverError as e:
+            logger.warning("⚠️  Scene %d: Solver failed - %s", scene_id, e)
+            return (scene_id, str(e))
+        
+        # =====================================================================
+        # STEP 4: Export Final Scene
+        # =====================================================================
+        _export_scene(scene_id, beams, topology, output_dir, prefix="")
+        return None
+        
+    except Exception as e:
+        logger.error("❌ Scene %d: Unexpected error - %s", scene_id, e)
+        return (scene_id, str(e))
+
+
 def _apply_perturbations(beams: List[BeamBase], 
                         scale: float,
                         seed: int) -> List[BeamBase]:
@@ -149,17 +193,11 @@ def _export_scene(scene_id: int,
         'identity_pairs': topology.get('identity_pairs', [])
     }
     
-    all_models = []
+    exported_stls = []
     
     for beam_idx, beam in enumerate(beams):
         beam_type = type(beam).__name__
-        from object_definitions import BEAM_TYPES, BEAM_NAMES
-        
-        semantic_label = None
-        for label, beam_class in BEAM_TYPES.items():
-            if beam_class.__name__ == beam_type:
-                semantic_label = label
-                break
+        semantic_label = _SEMANTIC_LABELS.get(beam_type)
         
         if semantic_label is None:
             raise ValueError(f"Unknown beam type: {beam_type}")
@@ -171,11 +209,12 @@ def _export_scene(scene_id: int,
             try:
                 model = beam.get_model()
                 export_stl(model, stl_path)
-                all_models.append(model)
+                exported_stls.append(stl_path)
             except Exception as e:
-                print(f"⚠️  Failed to export {prefix}beam {beam_idx}: {e}")
-                # DEBUG: Print the parameters that caused the failure
-                print(f"   🛑 BAD PARAMS: {beam.get_parameters()['values']}")
+                logger.warning("⚠️  Failed to export %sbeam %d: %s", prefix, beam_idx, e)
+                # DEBUG: Log the parameters that caused the failure
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("   🛑 BAD PARAMS: %s", beam.get_parameters()['values'])
                 continue
         
         beam_meta = {
@@ -186,15 +225,13 @@ def _export_scene(scene_id: int,
         }
         scene_meta['beams'].append(beam_meta)
     
-    # Export full scene
-    if BUILD123D_AVAILABLE and all_models:
+    # Export full scene (reuses the per-beam tessellation, no re-meshing)
+    if exported_stls:
         try:
-            from build123d import Compound
-            full_scene = Compound(children=all_models)
             full_scene_path = os.path.join(scene_dir, f"{prefix}full_scene.stl")
-            export_stl(full_scene, full_scene_path)
+            _write_combined_stl(exported_stls, full_scene_path)
         except Exception as e:
-            print(f"⚠️  Failed to export full scene: {e}")
+            logger.warning("⚠️  Failed to export full scene: %s", e)
     
     # Convert connectivity for JSON
     for face_name, contact_list in topology['connectivity'].items():
@@ -206,10 +243,45 @@ def _export_scene(scene_id: int,
         json.dump(scene_meta, f, indent=2)
 
 
+def _write_combined_stl(stl_paths: List[str], output_path: str) -> None:
+    """
+    Write one binary STL containing the triangles of all given binary STLs.
+    
+    Binary STL = 80-byte header + uint32 triangle count + 50 bytes per triangle,
+    so the output buffer is sized from the headers, filled in place, and
+    written with a single call.
+    """
+    if len(stl_paths) == 1:
+        shutil.copyfile(stl_paths[0], output_path)
+        return
+    
+    # Pass 1: triangle counts from the headers
+    counts = []
+    for path in stl_paths:
+        with open(path, 'rb') as f:
+            counts.append(struct.unpack_from('<I', f.read(84), 80)[0])
+    
+    buf = bytearray(84 + 50 * sum(counts))
+    buf[:80] = b"TimberTrace full scene".ljust(80, b"\0")
+    struct.pack_into('<I', buf, 80, sum(counts))
+    
+    # Pass 2: read each triangle block straight into its slice of the buffer
+    view = memoryview(buf)
+    offset = 84
+    for path, count in zip(stl_paths, counts):
+        with open(path, 'rb') as f:
+            f.seek(84)
+            f.readinto(view[offset:offset + 50 * count])
+        offset += 50 * count
+    
+    with open(output_path, 'wb', buffering=0) as f:
+        f.write(buf)
+
+
 def _create_index_file(output_dir: str, num_scenes: int, failed_scenes: List) -> None:
     """Create index.json"""
-    from object_definitions import BEAM_NAMES
-    successful_scenes = [f"scene_{i:04d}" for i in range(num_scenes) if i not in [s[0] for s in failed_scenes]]
+    failed_ids = {s[0] for s in failed_scenes}
+    successful_scenes = [f"scene_{i:04d}" for i in range(num_scenes) if i not in failed_ids]
     
     index_data = {
         'num_scenes': num_scenes,
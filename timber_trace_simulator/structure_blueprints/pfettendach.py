@@ -2,6 +2,16 @@ import numpy as np
 from typing import Tuple, List, Dict, Optional
 from object_definitions import Pfosten, Pfette, Sparren, BeamBase
 
+
+def _placed(beam: BeamBase, theta_z: float, x: float, y: float, z: float) -> BeamBase:
+    """Set a freshly constructed beam's pose and return it (for list comprehensions)."""
+    beam.theta_z = theta_z
+    beam.x = x
+    beam.y = y
+    beam.z = z
+    return beam
+
+
 def create_pfettendach(seed: Optional[int] = None, 
                        spar_count: int = 5, 
                        post_count: int = 3) -> Tuple[List[BeamBase], Dict]:
@@ -18,6 +28,7 @@ def create_pfettendach(seed: Optional[int] = None,
     # === 1. PARAMETERS ===
     # Roof Dimensions
     roof_len = 10.0  # Total length Y
+    half_len = roof_len / 2  # Gable ends at Y = +-half_len
     roof_half_span = 4.0  # Horizontal width X (one side)
     
     # Beam Dimensions
@@ -35,50 +46,46 @@ def create_pfettendach(seed: Optional[int] = None,
     spar_proj_len = roof_half_span + 0.5 # Overhang
     notch_depth = 0.05
     
+    # Purlin/post X offsets (purlin outer edge under the notch), shared by both sides
+    x_mittel = notch_mittel - pfette_w/2
+    x_fuss = notch_fuss - pfette_w/2
+    
     # === 2. CREATE PURLINS & POSTS ===
-    # Purlins run along Y (Length = roof_len)
+    # Purlins run along Y (Length = roof_len), all with the same cross-section
+    pfette_kwargs = dict(length=roof_len, width=pfette_w, height=pfette_h)
     
     # 1x Firstpfette (Ridge) - Shared
-    first_pfette = Pfette(length=roof_len, width=pfette_w, height=pfette_h)
+    first_pfette = Pfette(**pfette_kwargs)
     
     # 2x Mittelpfetten (Left/Right)
-    mittel_pfette_r = Pfette(length=roof_len, width=pfette_w, height=pfette_h)
-    mittel_pfette_l = Pfette(length=roof_len, width=pfette_w, height=pfette_h)
+    mittel_pfette_r = Pfette(**pfette_kwargs)
+    mittel_pfette_l = Pfette(**pfette_kwargs)
     
     # 2x Fusspfetten (Left/Right)
-    fuss_pfette_r = Pfette(length=roof_len, width=pfette_w, height=pfette_h)
-    fuss_pfette_l = Pfette(length=roof_len, width=pfette_w, height=pfette_h)
+    fuss_pfette_r = Pfette(**pfette_kwargs)
+    fuss_pfette_l = Pfette(**pfette_kwargs)
     
-    beams = [first_pfette, mittel_pfette_r, mittel_pfette_l, fuss_pfette_r, fuss_pfette_l]
+    pfetten = [first_pfette, mittel_pfette_r, mittel_pfette_l, fuss_pfette_r, fuss_pfette_l]
     # Indices: 0=First, 1=Mittel_R, 2=Mittel_L, 3=Fuss_R, 4=Fuss_L
     
     # Posts (Rows under Mittelpfetten)
-    posts = []
     post_spacing = roof_len / (post_count + 1) if post_count > 0 else 0
     
-    for i in range(post_count):
-        # Y position distributed along roof
-        y_pos = -roof_len/2 + (i + 1) * post_spacing
-        
-        # Right Post
-        p_r = Pfosten(height=post_h)
-        p_r.x = notch_mittel - pfette_w/2 # Under Mittelpfette
-        p_r.y = y_pos
-        p_r.z = 0.0 # Floor
-        posts.append(p_r)
-        
-        # Left Post (Mirrored X)
-        p_l = Pfosten(height=post_h)
-        p_l.x = -(notch_mittel - pfette_w/2)
-        p_l.y = y_pos
-        p_l.z = 0.0
-        posts.append(p_l)
-        
-    beams.extend(posts)
-    post_start_idx = 5
+    # Y positions distributed along roof (gable ends excluded)
+    post_ys = (-half_len + np.arange(1, post_count + 1) * post_spacing).tolist()
+    
+    # One Right + Left (Mirrored X) post per Y, standing on the floor under the Mittelpfetten
+    posts = [_placed(Pfosten(height=post_h), 0.0, x_post, y_pos, 0.0)
+             for y_pos in post_ys
+             for x_post in (x_mittel, -x_mittel)]
+    
+    post_start_idx = len(pfetten)
     
     # === 3. CREATE SPARS (RAFTERS) ===
-    spars = []
+    # All spars share one cross-section and notch layout (Left = Right rotated 180 deg)
+    spar_kwargs = dict(width=spar_w, height=spar_h, projected_length=spar_proj_len, steepness=steepness,
+                       notch_x_mittel=notch_mittel, notch_x_fuss=notch_fuss, notch_top_length=notch_first,
+                       notch_mittel_depth=notch_depth, notch_fuss_depth=notch_depth)
     spar_spacing = roof_len / (spar_count - 1) if spar_count > 1 else 0
     
     # Z Calculation (Reference Height for Ridge)
@@ -87,35 +94,22 @@ def create_pfettendach(seed: Optional[int] = None,
     z_mittel_purlin = post_h
     z_ridge_global = z_mittel_purlin + pfette_h + (steepness * notch_mittel) + spar_h - notch_depth
     
-    for i in range(spar_count):
-        y_pos = -roof_len/2 + i * spar_spacing
-        
-        # --- Right Spar (0 deg) ---
-        s_r = Sparren(width=spar_w, height=spar_h, projected_length=spar_proj_len, steepness=steepness,
-                      notch_x_mittel=notch_mittel, notch_x_fuss=notch_fuss, notch_top_length=notch_first,
-                      notch_mittel_depth=notch_depth, notch_fuss_depth=notch_depth)
-        s_r.theta_z = 0.0
-        s_r.x = 0.0
-        s_r.y = y_pos
-        s_r.z = z_ridge_global
-        spars.append(s_r)
-        
-        # --- Left Spar (180 deg) ---
-        s_l = Sparren(width=spar_w, height=spar_h, projected_length=spar_proj_len, steepness=steepness,
-                      notch_x_mittel=notch_mittel, notch_x_fuss=notch_fuss, notch_top_length=notch_first,
-                      notch_mittel_depth=notch_depth, notch_fuss_depth=notch_depth)
-        s_l.theta_z = np.pi # 180 degrees
-        s_l.x = 0.0
-        s_l.y = y_pos
-        s_l.z = z_ridge_global
-        spars.append(s_l)
-        
-    beams.extend(spars)
+    # Y positions of all spar pairs, evenly spaced from one gable end to the other
+    spar_ys = (-half_len + np.arange(spar_count) * spar_spacing).tolist()
+    
+    # One Right (0 deg) + Left (180 deg) spar per Y, meeting at the ridge (X=0)
+    spars = [_placed(Sparren(**spar_kwargs), theta_z, 0.0, y_pos, z_ridge_global)
+             for y_pos in spar_ys
+             for theta_z in (0.0, np.pi)]
+    
     spar_start_idx = post_start_idx + len(posts)
     
+    # Beam list in index order (built once, sizes known here)
+    beams = pfetten + posts + spars
+    
     # === 4. POSITION PURLINS ===
     # Align Purlins with Y-axis (Theta=0)
-    for p in [first_pfette, mittel_pfette_r, mittel_pfette_l, fuss_pfette_r, fuss_pfette_l]:
+    for p in pfetten:
         p.theta_z = 0.0
         p.y = 0.0 # Centered Y
     
@@ -126,54 +120,49 @@ def create_pfettendach(seed: Optional[int] = None,
     first_pfette.z = z_ridge_global - spar_h - pfette_h 
     
     # Mittelpfette R
-    mittel_pfette_r.x = notch_mittel - pfette_w/2
+    mittel_pfette_r.x = x_mittel
     mittel_pfette_r.z = post_h
     
     # Mittelpfette L (Mirrored)
-    mittel_pfette_l.x = -(notch_mittel - pfette_w/2)
+    mittel_pfette_l.x = -x_mittel
     mittel_pfette_l.z = post_h
     
     # Fusspfette R
-    fuss_pfette_r.x = notch_fuss - pfette_w/2
+    fuss_pfette_r.x = x_fuss
     fuss_pfette_r.z = z_ridge_global - (steepness * notch_fuss) - spar_h + notch_depth - pfette_h
     
     # Fusspfette L
-    fuss_pfette_l.x = -(notch_fuss - pfette_w/2)
+    fuss_pfette_l.x = -x_fuss
     fuss_pfette_l.z = fuss_pfette_r.z
     
     # === 5. CONNECTIVITY ===
     connectivity = {'top': [], 'bottom': [], 'left': [], 'right': [], 'front': [], 'back': []}
     
     # A. Posts -> Mittelpfetten
-    # Even indices = Right Posts, Odd = Left Posts
-    for i in range(len(posts)):
-        post_idx = post_start_idx + i
-        # Right Posts -> Mittelpfette R (Index 1)
-        if i % 2 == 0: 
-            connectivity['top'].append((post_idx, 1, 4, 5, 0, 0))
-        # Left Posts -> Mittelpfette L (Index 2)
-        else:
-            connectivity['top'].append((post_idx, 2, 4, 5, 0, 0))
+    # Even indices = Right Posts -> Mittelpfette R (Index 1)
+    # Odd indices  = Left Posts  -> Mittelpfette L (Index 2)
+    connectivity['top'].extend(
+        (post_start_idx + i, 1 if i % 2 == 0 else 2, 4, 5, 0, 0) for i in range(len(posts))
+    )
             
     # B. Purlins -> Sparren
     # Even indices = Right Spars, Odd = Left Spars
+    # Target purlins (purlin_idx, notch_idx), shared by all spars of one side
+    targets_r = (
+        (0, 2), # Firstpfette (Index 0) -> Top Notch (Index 2)
+        (1, 1), # Mittel R    (Index 1) -> Mittel Notch (Index 1)
+        (3, 0)  # Fuss R      (Index 3) -> Fuss Notch (Index 0)
+    )
+    targets_l = (
+        (0, 2), # Firstpfette (Index 0)
+        (2, 1), # Mittel L    (Index 2)
+        (4, 0)  # Fuss L      (Index 4)
+    )
+    
     for i in range(len(spars)):
         spar_idx = spar_start_idx + i
         is_right = (i % 2 == 0)
-        
-        # Determine target purlins
-        if is_right:
-            targets = [
-                (0, 2), # Firstpfette (Index 0) -> Top Notch (Index 2)
-                (1, 1), # Mittel R    (Index 1) -> Mittel Notch (Index 1)
-                (3, 0)  # Fuss R      (Index 3) -> Fuss Notch (Index 0)
-            ]
-        else:
-            targets = [
-                (0, 2), # Firstpfette (Index 0)
-                (2, 1), # Mittel L    (Index 2)
-                (4, 0)  # Fuss L      (Index 4)
-            ]
+        targets = targets_r if is_right else targets_l
             
         for purlin_idx, notch_idx in targets:
             # 1. Vertical Load (Purlin Top -> Sparren Bottom Shelf)
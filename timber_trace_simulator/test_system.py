@@ -3,24 +3,79 @@
 Quick validation script to test the constraint-based generation system.
 
 Tests:
-  1. Blueprint creation
-  2. Constraint solver
-  3. Geometry generation
+  1. Direction mapping
+  2. Expression linearization
+  3. Blueprint creation
+  4. Constraint solver
+  5. Geometry generation
 """
 
 import numpy as np
-from structure_blueprints.simple_structures import post_and_beam, two_posts_only
+from structure_blueprints.simple_structures import post_and_beam
 from constraint_solver import solve_constraints
 from object_definitions import Pfosten, Pfette
+from utils.cvxpy_helpers import linearize_expression
+
+
+# Outward unit normal of each face in LOCAL coords: 0=Right, 1=Left, 2=Front, 3=Back, 4=Top, 5=Bottom
+FACE_NORMALS = np.array([
+    [1, 0, 0], [-1, 0, 0],
+    [0, 1, 0], [0, -1, 0],
+    [0, 0, 1], [0, 0, -1],
+], dtype=float)
+
+
+def test_direction_mapping():
+    """Test map_global_to_local_direction against the rotation matrix (4 quadrants x 6 faces)"""
+    print("\n" + "="*80)
+    print("TEST 1: Direction Mapping")
+    print("="*80)
+    
+    beam = Pfette()
+    for quadrant in range(4):
+        theta_z = quadrant * np.pi / 2
+        R = beam._rotation_matrix(theta_z)
+        for global_dir in range(6):
+            local_dir = beam.map_global_to_local_direction(global_dir, theta_z)
+            # The local face, rotated into GLOBAL coords, must point along the requested global face
+            assert np.allclose(R @ FACE_NORMALS[local_dir], FACE_NORMALS[global_dir]), \
+                f"theta_z={quadrant * 90} deg: Global {global_dir} -> Local {local_dir}"
+    
+    print("✓ All 24 global -> local face mappings match the rotation matrix")
+
+
+def test_linearization():
+    """Test that constraint expressions are split into coefficients correctly"""
+    print("\n" + "="*80)
+    print("TEST 2: Expression Linearization")
+    print("="*80)
+    
+    # Parameters are matched as whole identifiers: self.x must not match inside self.x_offset
+    coeffs, constant = linearize_expression("self.x_offset + 2*self.x + slack_0",
+                                            {'x': 1.0, 'x_offset': 3.0}, ['x'], ['slack_0'])
+    assert coeffs == {'x': 2.0, 'slack_0': 1.0}, coeffs
+    assert constant == 3.0, constant
+    
+    coeffs, _ = linearize_expression("self.x_offset", {'x': 1.0, 'x_offset': 3.0}, ['x'], [])
+    assert coeffs == {}, coeffs
+    print("✓ Parameters and slacks detected by identifier")
+    
+    # Non-affine expressions must be rejected, not silently linearized to zero
+    try:
+        linearize_expression("self.a * self.b", {'a': 2.0, 'b': 3.0}, ['a', 'b'], [])
+    except ValueError:
+        print("✓ Non-affine expression rejected")
+    else:
+        raise AssertionError("Non-affine expression 'self.a * self.b' was accepted")
 
 
 def test_blueprint():
     """Test that blueprint creates valid structure"""
     print("\n" + "="*80)
-    print("TEST 1: Blueprint Creation")
+    print("TEST 3: Blueprint Creation")
     print("="*80)
     
-    beams, topology = post_and_beam(spacing=3.0, seed=42)
+    beams, topology = post_and_beam(seed=42)
     
     print(f"✓ Created {len(beams)} beams")
     print(f"  - Post 1: x={beams[0].x:.2f}, height={beams[0].height:.2f}")
@@ -38,7 +93,7 @@ def test_blueprint():
 def test_solver(beams, topology):
     """Test that constraint solver works"""
     print("\n" + "="*80)
-    print("TEST 2: Constraint Solver")
+    print("TEST 4: Constraint Solver")
     print("="*80)
     
     # Store initial positions
@@ -87,7 +142,7 @@ def test_solver(beams, topology):
 def test_geometry(beams):
     """Test that geometry generation works"""
     print("\n" + "="*80)
-    print("TEST 3: Geometry Generation")
+    print("TEST 5: Geometry Generation")
     print("="*80)
     
     try:
@@ -106,13 +161,19 @@ def main():
     print("="*80)
     
     try:
-        # Test 1: Blueprint
+        # Test 1: Direction mapping
+        test_direction_mapping()
+        
+        # Test 2: Linearization
+        test_linearization()
+        
+        # Test 3: Blueprint
         beams, topology = test_blueprint()
         
-        # Test 2: Solver
+        # Test 4: Solver
         solved_beams = test_solver(beams, topology)
         
-        # Test 3: Geometry
+        # Test 5: Geometry
         test_geometry(solved_beams)
         
         print("\n" + "="*80)
@@ -1,6 +1,6 @@
 # utils/__init__.py
 """Utilities for constraint solving and scene generation"""
 
-from .cvxpy_helpers import extract_slack_tokens, evaluate_expression, transform_local_to_global
+from .cvxpy_helpers import extract_slack_tokens, evaluate_expression, linearize_expression, transform_local_to_global
 
-__all__ = ['extract_slack_tokens', 'evaluate_expression', 'transform_local_to_global']
\ No newline at end of file
+__all__ = ['extract_slack_tokens', 'evaluate_expression', 'linearize_expression', 'transform_local_to_global']
\ No newline at end of file
@@ -5,6 +5,8 @@ Utilities for parsing constraint equations and building CVXPY problems.
 
 import re
 import numpy as np
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Dict, List, Tuple, Set
 
 
@@ -37,6 +39,17 @@ def extract_slack_tokens(constraint_equations: List['ConstraintEquation']) -> Se
     return all_tokens
 
 
+@lru_cache(maxsize=1024)
+def _compile_expression(expr_str: str):
+    """
+    Compile a constraint expression once.
+    
+    Expressions come from the static per-class constraint tables, so the set of
+    distinct strings is small and every later evaluation reuses the code object.
+    """
+    return compile(expr_str, '<constraint>', 'eval')
+
+
 def evaluate_expression(expr_str: str, 
                        beam_params: Dict[str, float],
                        cvxpy_vars: Dict[str, 'cvxpy.Variable'] = None,
@@ -62,45 +75,92 @@ def evaluate_expression(expr_str: str,
         evaluate_expression("slack_0", {}, slack_vars={'slack_0': cp.Variable()}) 
         -> cvxpy.Variable object
     """
-    # Replace self.* with values from beam_params or cvxpy_vars
-    result_expr = expr_str
-    
-    # Handle self.parameter references
-    for param_name, param_value in beam_params.items():
-        pattern = f'self.{param_name}'
-        if pattern in result_expr:
-            if cvxpy_vars and param_name in cvxpy_vars:
-                # CVXPY mode: use variable
-                result_expr = result_expr.replace(pattern, f'cvxpy_vars["{param_name}"]')
-            else:
-                # Numerical mode: use value
-                result_expr = result_expr.replace(pattern, str(param_value))
-    
-    # Handle slack variables - check if they're in the expression
-    if slack_vars:
-        for slack_name, slack_value in slack_vars.items():
-            if slack_name in result_expr:
-                # For CVXPY mode, wrap in dict lookup; for numerical, use direct value
-                if hasattr(slack_value, '__module__') and 'cvxpy' in str(type(slack_value)):
-                    # CVXPY variable
-                    result_expr = result_expr.replace(slack_name, f'slack_vars["{slack_name}"]')
-                else:
-                    # Numerical value
-                    result_expr = result_expr.replace(slack_name, str(slack_value))
-    
-    # Evaluate the expression
-    # Create evaluation context with numpy for math operations
-    eval_context = {
-        'cvxpy_vars': cvxpy_vars or {},
-        'slack_vars': slack_vars or {},
-        'np': np
-    }
+    # self.* resolves to the CVXPY variable if given, else the numerical value
+    if cvxpy_vars:
+        values = {k: cvxpy_vars.get(k, v) for k, v in beam_params.items()}
+    else:
+        values = beam_params
+    
+    # Evaluation context: parameters under 'self', slacks by name, numpy for math operations
+    eval_context = dict(slack_vars) if slack_vars else {}
+    eval_context['self'] = SimpleNamespace(**values)
+    eval_context['np'] = np
     
     try:
-        result = eval(result_expr, {"__builtins__": {}}, eval_context)
-        return result
+        return eval(_compile_expression(expr_str), {"__builtins__": {}}, eval_context)
     except Exception as e:
-        raise ValueError(f"Failed to evaluate expression '{expr_str}': {e}\nProcessed as: '{result_expr}'")
+        raise ValueError(f"Failed to evaluate expression '{expr_str}': {e}")
+
+
+_PARAM_TOKEN = re.compile(r'\bself\.([A-Za-z_]\w*)\b')
+_SLACK_TOKEN = re.compile(r'\bslack_\d+\b')
+
+
+@lru_cache(maxsize=1024)
+def _referenced_names(expr_str: str) -> Tuple[frozenset, frozenset]:
+    """(parameter names, slack tokens) referenced by an expression, matched as whole identifiers"""
+    return frozenset(_PARAM_TOKEN.findall(expr_str)), frozenset(_SLACK_TOKEN.findall(expr_str))
+
+
+def linearize_expression(expr_str: str,
+                         beam_params: Dict[str, float],
+                         var_names: List[str],
+                         slack_names: List[str]) -> Tuple[Dict[str, float], float]:
+    """
+    Split an AFFINE constraint expression into numeric coefficients + constant.
+
+    Parameters listed in var_names (and all slacks) are treated as unknowns;
+    every other parameter is substituted with its current value.
+
+    Args:
+        expr_str: Expression like "-self.width/2" or "slack_0"
+        beam_params: Dictionary of beam parameters (current values)
+        var_names: Parameters that are optimization variables
+        slack_names: Slack tokens available to the expression (e.g. ['slack_0'])
+
+    Returns:
+        (coeffs, constant) such that expr == constant + sum(coeffs[name] * name)
+
+    Raises:
+        ValueError: If the expression is not affine in the unknowns (e.g. "self.a * self.b")
+
+    Example:
+        linearize_expression("-self.width/2", {'width': 0.12}, ['width'], [])
+        -> ({'width': -0.5}, 0.0)
+    """
+    param_refs, slack_refs = _referenced_names(expr_str)
+    
+    # Unknowns are evaluated at 0 so the result IS the constant term
+    values = {k: (0.0 if k in var_names else v) for k, v in beam_params.items()}
+    slacks = {name: 0.0 for name in slack_names}
+    constant = evaluate_expression(expr_str, values, slack_vars=slacks)
+
+    # Unit step per referenced unknown yields its coefficient (exact for affine expressions)
+    coeffs = {}
+    for name in var_names:
+        if name in param_refs:
+            values[name] = 1.0
+            coeffs[name] = evaluate_expression(expr_str, values, slack_vars=slacks) - constant
+            values[name] = 0.0
+    for name in slack_names:
+        if name in slack_refs:
+            slacks[name] = 1.0
+            coeffs[name] = evaluate_expression(expr_str, values, slack_vars=slacks) - constant
+            slacks[name] = 0.0
+
+    # Affinity check: with every unknown at 2 an affine expression equals constant + 2*sum(coeffs)
+    if coeffs:
+        for name in coeffs:
+            if name in slacks:
+                slacks[name] = 2.0
+            else:
+                values[name] = 2.0
+        probe = evaluate_expression(expr_str, values, slack_vars=slacks)
+        expected = constant + 2.0 * sum(coeffs.values())
+        if not np.isclose(probe, expected, rtol=1e-9, atol=1e-9):
+            raise ValueError(f"Expression '{expr_str}' is not affine in {sorted(coeffs)}")
+
+    return coeffs, float(constant)
 
 
 def transform_local_to_global(p_local: np.ndarray, 
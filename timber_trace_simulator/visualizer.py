@@ -116,7 +116,7 @@ def get_beam_info(beam_type_id):
     for face_idx, face_name in enumerate(FACE_NAMES):
         try:
             constraints = beam.get_constraints(face_idx)
-            if not isinstance(constraints, list):
+            if not isinstance(constraints, (list, tuple)):
                 constraints = [constraints]
             
             constraints_info[face_name] = {